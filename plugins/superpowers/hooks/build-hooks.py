@@ -35,7 +35,9 @@ def main():
         }
     }
 
-    hook_json = json.dumps(hook_output, ensure_ascii=False)
+    # Compact separators: this payload is baked into the command Claude Code
+    # runs every session, so pretty-printing whitespace is pure overhead.
+    hook_json = json.dumps(hook_output, ensure_ascii=False, separators=(',', ':'))
     # base64 output is [A-Za-z0-9+/=] only — no shell quoting needed, no
     # special characters to mangle, works identically in Git Bash and WSL.
     hook_b64 = base64.b64encode(hook_json.encode('utf-8')).decode('ascii')
@@ -57,9 +59,24 @@ def main():
         }
     }
 
-    with open(HOOKS_PATH, 'w', encoding='utf-8') as f:
-        json.dump(hooks, f, indent=2, ensure_ascii=False)
-        f.write('\n')
+    # Encoded once and handled as bytes from here on: no decode when
+    # comparing against the existing file, and no newline translation, so
+    # Windows writes the same LF-only file as everywhere else.
+    content = (json.dumps(hooks, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+
+    # Leave hooks.json (and its mtime) alone when the skill hasn't changed,
+    # so re-running the build doesn't look like a change to anything
+    # watching the file.
+    try:
+        with open(HOOKS_PATH, 'rb') as f:
+            if f.read() == content:
+                print(f"{HOOKS_PATH} is up to date")
+                return
+    except FileNotFoundError:
+        pass
+
+    with open(HOOKS_PATH, 'wb') as f:
+        f.write(content)
 
     print(f"Updated {HOOKS_PATH}")
 
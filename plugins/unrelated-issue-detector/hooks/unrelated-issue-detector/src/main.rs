@@ -228,6 +228,20 @@ fn main() {
 mod tests {
     use super::*;
 
+    #[test]
+    fn patterns_are_lowercase_ascii_words() {
+        // scan_text compares against lowercased text, so an uppercase pattern
+        // byte could never match. Equivalent to `^[a-z -]+$`.
+        for pattern in PATTERNS {
+            assert!(
+                !pattern.is_empty()
+                    && pattern.bytes().all(|b| b.is_ascii_lowercase() || b == b' ' || b == b'-'),
+                "pattern {:?} must match ^[a-z -]+$",
+                pattern
+            );
+        }
+    }
+
     #[test]
     fn detects_pre_existing_issue() {
         let mut findings = Vec::new();
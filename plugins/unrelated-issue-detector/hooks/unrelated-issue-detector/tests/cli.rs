@@ -0,0 +1,238 @@
+//! Integration tests driving the hook binary via stdin/stdout against a real
+//! transcript file — the actual contract Claude Code uses. Cargo builds the
+//! binary before running.
+
+use serde_json::{json, Value};
+use std::env;
+use std::fs::{self, OpenOptions};
+use std::io::Write;
+use std::path::PathBuf;
+use std::process::{Command, Stdio};
+use std::time::{SystemTime, UNIX_EPOCH};
+
+/// A transcript plus the hook's offset file for a session id no other test
+/// (or earlier run) uses. Both files are removed on drop.
+struct Session {
+    id: String,
+    transcript: PathBuf,
+}
+
+impl Session {
+    fn new(name: &str) -> Self {
+        let nanos = SystemTime::now()
+            .duration_since(UNIX_EPOCH)
+            .unwrap()
+            .as_nanos();
+        let id = format!("cli-test-{}-{}-{}", name, std::process::id(), nanos);
+        let transcript = env::temp_dir().join(format!("{}.jsonl", id));
+        fs::write(&transcript, "").expect("create transcript");
+        Session { id, transcript }
+    }
+
+    fn offset_file(&self) -> PathBuf {
+        env::temp_dir().join(format!("unrelated-issue-{}.offset", self.id))
+    }
+
+    fn append(&self, text: &str) {
+        OpenOptions::new()
+            .append(true)
+            .open(&self.transcript)
+            .expect("open transcript")
+            .write_all(text.as_bytes())
+            .expect("append transcript");
+    }
+
+    fn run_hook(&self) -> (String, i32) {
+        let input = json!({
+            "session_id": self.id,
+            "transcript_path": self.transcript.to_str().unwrap(),
+        });
+        let bin = env!("CARGO_BIN_EXE_unrelated-issue-detector");
+        let mut child = Command::new(bin)
+            .stdin(Stdio::piped())
+            .stdout(Stdio::piped())
+            .stderr(Stdio::piped())
+            .spawn()
+            .expect("spawn hook binary");
+        child
+            .stdin
+            .as_mut()
+            .expect("stdin")
+            .write_all(input.to_string().as_bytes())
+            .expect("write stdin");
+        let out = child.wait_with_output().expect("wait");
+        (
+            String::from_utf8(out.stdout).expect("utf8 stdout"),
+            out.status.code().unwrap_or(-1),
+        )
+    }
+
+    fn saved_offset(&self) -> u64 {
+        fs::read_to_string(self.offset_file())
+            .expect("offset file written")
+            .trim()
+            .parse()
+            .expect("numeric offset")
+    }
+
+    fn transcript_len(&self) -> u64 {
+        fs::metadata(&self.transcript).unwrap().len()
+    }
+}
+
+impl Drop for Session {
+    fn drop(&mut self) {
+        let _ = fs::remove_file(&self.transcript);
+        let _ = fs::remove_file(self.offset_file());
+    }
+}
+
+fn assistant_line(text: &str) -> String {
+    json!({
+        "type": "assistant",
+        "message": {"role": "assistant", "content": [{"type": "text", "text": text}]}
+    })
+    .to_string()
+}
+
+fn tool_result_line(text: &str) -> String {
+    json!({
+        "type": "user",
+        "message": {"role": "user", "content": [{"type": "tool_result", "content": text}]}
+    })
+    .to_string()
+}
+
+fn block_reason(stdout: &str) -> String {
+    let v: Value = serde_json::from_str(stdout.trim())
+        .unwrap_or_else(|e| panic!("expected JSON on stdout, got {:?}: {}", stdout, e));
+    assert_eq!(v["decision"], "block", "{}", stdout);
+    v["reason"].as_str().expect("reason").to_string()
+}
+
+// ---------------------------------------------------------------------------
+// Detection
+// ---------------------------------------------------------------------------
+
+#[test]
+fn blocks_on_dismissal_in_assistant_text() {
+    let s = Session::new("assistant");
+    s.append(&format!(
+        "{}\n{}\n",
+        tool_result_line("3 passed"),
+        assistant_line("The lint failure is a pre-existing issue.")
+    ));
+    let (stdout, code) = s.run_hook();
+    assert_eq!(code, 0);
+    assert!(block_reason(&stdout).contains("\"pre-existing issue\""));
+}
+
+#[test]
+fn handles_crlf_line_endings() {
+    let s = Session::new("crlf");
+    s.append(&format!(
+        "{}\r\n{}\r\n{}\r\n",
+        tool_result_line("ok"),
+        assistant_line("That test is unrelated to this change."),
+        assistant_line("Done."),
+    ));
+    let (stdout, code) = s.run_hook();
+    assert_eq!(code, 0);
+    assert!(block_reason(&stdout).contains("\"unrelated to this change\""));
+}
+
+#[test]
+fn ignores_dismissal_only_in_tool_result() {
+    let s = Session::new("tool-result");
+    s.append(&format!(
+        "{}\n{}\n",
+        tool_result_line("error: pre-existing issue in vendored code"),
+        assistant_line("All green."),
+    ));
+    let (stdout, code) = s.run_hook();
+    assert_eq!(code, 0);
+    assert!(stdout.is_empty(), "expected no block, got {stdout:?}");
+}
+
+#[test]
+fn resumes_scan_after_non_assistant_hit() {
+    // The first hit is in a tool result; the scan must carry on past that
+    // line and still find the assistant's dismissal further down.
+    let s = Session::new("resume");
+    s.append(&format!(
+        "{}\n{}\n{}",
+        tool_result_line("broken on main since yesterday"),
+        assistant_line("Nothing to see."),
+        assistant_line("Skipping it, that was already broken on main."),
+    ));
+    let (stdout, code) = s.run_hook();
+    assert_eq!(code, 0);
+    let reason = block_reason(&stdout);
+    assert!(reason.contains("\"already broken on main\""), "{reason}");
+    assert!(reason.contains("\"broken on main\""), "{reason}");
+}
+
+#[test]
+fn reports_every_pattern_once() {
+    let s = Session::new("all");
+    let patterns = [
+        "pre-existing issue",
+        "not caused by my change",
+        "out of scope for this",
+        "separate bug from",
+    ];
+    let line = assistant_line(&patterns.join(". "));
+    s.append(&format!("{line}\n{line}\n"));
+    let (stdout, _) = s.run_hook();
+    let reason = block_reason(&stdout);
+    for pattern in patterns {
+        assert_eq!(reason.matches(&format!("\"{pattern}\"")).count(), 1, "{reason}");
+    }
+}
+
+// ---------------------------------------------------------------------------
+// Offset tracking
+// ---------------------------------------------------------------------------
+
+#[test]
+fn saves_offset_at_end_of_transcript() {
+    let s = Session::new("offset");
+    s.append(&format!("{}\n", assistant_line("Clean run, nothing dismissed.")));
+    let (stdout, code) = s.run_hook();
+    assert_eq!(code, 0);
+    assert!(stdout.is_empty());
+    assert_eq!(s.saved_offset(), s.transcript_len());
+}
+
+#[test]
+fn rerun_is_silent_and_appended_text_is_scanned() {
+    let s = Session::new("rerun");
+    s.append(&format!("{}\n", assistant_line("A pre-existing bug, leaving it.")));
+    let (stdout, _) = s.run_hook();
+    assert!(block_reason(&stdout).contains("\"pre-existing bug\""));
+    assert_eq!(s.saved_offset(), s.transcript_len());
+
+    let (stdout, code) = s.run_hook();
+    assert_eq!(code, 0);
+    assert!(stdout.is_empty(), "rerun should be silent, got {stdout:?}");
+
+    s.append(&format!("{}\n", assistant_line("This is not related to my changes.")));
+    let (stdout, _) = s.run_hook();
+    let reason = block_reason(&stdout);
+    assert!(reason.contains("\"not related to my changes\""), "{reason}");
+    assert!(!reason.contains("\"pre-existing bug\""), "{reason}");
+    assert_eq!(s.saved_offset(), s.transcript_len());
+}
+
+// ---------------------------------------------------------------------------
+// Robustness
+// ---------------------------------------------------------------------------
+
+#[test]
+fn missing_transcript_noop() {
+    let s = Session::new("missing");
+    fs::remove_file(&s.transcript).unwrap();
+    let (stdout, code) = s.run_hook();
+    assert_eq!(code, 0);
+    assert!(stdout.is_empty());
+}
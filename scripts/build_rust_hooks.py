@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Shared build logic for the Rust hook plugins: cross-compiles hook crates for
+Linux x86_64 and Windows x86_64, then copies each binary to its plugin's
+hooks/bin/.
+
+Each plugin's hooks/build-hooks.py calls build() for its own crate. Run this
+file directly to build every hook crate in the workspace in one pass.
+
+Prerequisites:
+  - Rust toolchain with targets:
+      rustup target add x86_64-unknown-linux-gnu
+      rustup target add x86_64-pc-windows-msvc
+  - On Windows: cargo-zigbuild + zig for Linux cross-compilation:
+      cargo install cargo-zigbuild
+      uv tool install ziglang
+  - On Linux: cargo-xwin for Windows cross-compilation:
+      cargo install cargo-xwin
+  - Optional: sccache, picked up automatically to cache compiled crates
+    across runs and targets:
+      cargo install sccache
+
+Binaries target the baseline x86_64 ISA. Set HOOKS_TARGET_CPU to build for a
+higher microarchitecture level, e.g. HOOKS_TARGET_CPU=x86-64-v2 (SSE4.2,
+POPCNT) or x86-64-v3 (AVX2). This changes every hook binary and raises the
+minimum CPU they run on.
+"""
+import json
+import os
+import platform
+import shutil
+import stat
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IS_WINDOWS = platform.system() == 'Windows'
+
+PLATFORM_TARGETS = [
+    {'triple': 'x86_64-unknown-linux-gnu', 'ext': '', 'cmd': 'zigbuild' if IS_WINDOWS else 'build'},
+    {'triple': 'x86_64-pc-windows-msvc', 'ext': '.exe', 'cmd': 'build' if IS_WINDOWS else 'xwin build'},
+]
+
+CARGO_JOBS = os.cpu_count() or 1
+
+SCCACHE = shutil.which('sccache')
+
+TARGET_CPU = os.environ.get('HOOKS_TARGET_CPU', '')
+
+
+def build_target(crates: list[str], triple: str, cmd: str = 'build') -> None:
+    """Build all `crates` for one target in a single cargo invocation."""
+    print(f"Building {', '.join(crates)} for {triple} (cargo {cmd})...")
+    env = {**os.environ, 'CARGO_BUILD_JOBS': str(CARGO_JOBS), 'CARGO_INCREMENTAL': '0'}
+    if SCCACHE and 'RUSTC_WRAPPER' not in env:
+        env['RUSTC_WRAPPER'] = SCCACHE
+    if TARGET_CPU:
+        # Target-scoped rather than RUSTFLAGS: a plain RUSTFLAGS would override
+        # the target flags cargo-xwin/cargo-zigbuild set, and would also apply
+        # to build scripts compiled for the host. Cargo ignores the
+        # target-scoped variable when RUSTFLAGS is set, so extend that instead.
+        var = 'RUSTFLAGS' if 'RUSTFLAGS' in env else f"CARGO_TARGET_{triple.upper().replace('-', '_')}_RUSTFLAGS"
+        env[var] = f"{env.get(var, '')} -C target-cpu={TARGET_CPU}".strip()
+    packages = [arg for crate in crates for arg in ('-p', crate)]
+    subprocess.run(
+        ['cargo', *cmd.split(), '--release', '--target', triple, '--jobs', str(CARGO_JOBS), *packages],
+        cwd=REPO_ROOT,
+        env=env,
+        check=True,
+    )
+
+
+def workspace_metadata() -> dict:
+    """Return `cargo metadata` for the workspace (members only, no deps)."""
+    result = subprocess.run(
+        ['cargo', 'metadata', '--format-version', '1', '--no-deps'],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def copy_binary(target_dir: str, crate_dir: str, crate_name: str, triple: str, ext: str) -> None:
+    src = os.path.join(target_dir, triple, 'release', crate_name + ext)
+    bin_dir = os.path.join(os.path.dirname(crate_dir), 'bin')
+    dst = os.path.join(bin_dir, crate_name + ext)
+    os.makedirs(bin_dir, exist_ok=True)
+    shutil.copy2(src, dst)
+    os.chmod(dst, os.stat(dst).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    if not ext:
+        subprocess.run(['git', 'update-index', '--chmod=+x', dst], check=False)
+    print(f"Copied {src} -> {dst}")
+
+
+def build(crates: list[str]) -> None:
+    """Build `crates` for every platform target and copy them to hooks/bin/."""
+    metadata = workspace_metadata()
+    crate_dirs = {p['name']: os.path.dirname(p['manifest_path']) for p in metadata['packages']}
+
+    # One cargo invocation per target builds all crates, letting cargo
+    # schedule them in parallel. Targets run one after another: they share
+    # the workspace target directory, whose build lock would serialize
+    # concurrent cargo processes anyway.
+    for target in PLATFORM_TARGETS:
+        try:
+            build_target(crates, target['triple'], target['cmd'])
+        except subprocess.CalledProcessError:
+            print(f"WARNING: failed to build for {target['triple']}, skipping", file=sys.stderr)
+            continue
+        for crate_name in crates:
+            copy_binary(metadata['target_directory'], crate_dirs[crate_name], crate_name, target['triple'], target['ext'])
+
+    print("Done.")
+
+
+if __name__ == '__main__':
+    build(sorted(p['name'] for p in workspace_metadata()['packages']))